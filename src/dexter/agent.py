@@ -1,8 +1,11 @@
+import asyncio
+import threading
+from concurrent.futures import Executor
 from typing import List, Optional
 
 from langchain_core.messages import AIMessage
 
-from dexter.model import call_llm
+from dexter.model import call_llm_async
 from dexter.prompts import (
     ACTION_SYSTEM_PROMPT,
     ANSWER_SYSTEM_PROMPT,
@@ -16,15 +19,38 @@ from dexter.utils.logger import Logger
 from dexter.utils.ui import show_progress
 
 
+# LLM clients pool async connections on the loop that first used them, so every
+# synchronous Agent.run shares one long-lived loop instead of asyncio.run's fresh one.
+_sync_loop: Optional[asyncio.AbstractEventLoop] = None
+_sync_loop_lock = threading.Lock()
+
+
+def _get_sync_loop() -> asyncio.AbstractEventLoop:
+    global _sync_loop
+    with _sync_loop_lock:
+        if _sync_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="dexter-agent-loop", daemon=True).start()
+            _sync_loop = loop
+    return _sync_loop
+
+
 class Agent:
-    def __init__(self, max_steps: int = 20, max_steps_per_task: int = 5, logger: Optional[Logger] = None):
+    def __init__(
+        self,
+        max_steps: int = 20,
+        max_steps_per_task: int = 5,
+        logger: Optional[Logger] = None,
+        executor: Optional[Executor] = None,
+    ):
         self.logger = logger or Logger()
         self.max_steps = max_steps            # global safety cap
         self.max_steps_per_task = max_steps_per_task
+        self.executor = executor              # runs blocking tool calls; None uses the loop default
 
     # ---------- task planning ----------
     @show_progress("Planning tasks...", "Tasks planned")
-    def plan_tasks(self, query: str) -> List[Task]:
+    async def plan_tasks(self, query: str) -> List[Task]:
         tool_descriptions = "\n".join([f"- {t.name}: {t.description}" for t in TOOLS])
         prompt = f"""
         Given the user query: "{query}",
@@ -33,7 +59,7 @@ class Agent:
         """
         system_prompt = PLANNING_SYSTEM_PROMPT.format(tools=tool_descriptions)
         try:
-            response = call_llm(prompt, system_prompt=system_prompt, output_schema=TaskList)
+            response = await call_llm_async(prompt, system_prompt=system_prompt, output_schema=TaskList)
             tasks = response.tasks
         except Exception as e:
             self.logger._log(f"Planning failed: {e}")
@@ -45,7 +71,7 @@ class Agent:
 
     # ---------- ask LLM what to do ----------
     @show_progress("Thinking...", "")
-    def ask_for_actions(self, task_desc: str, last_outputs: str = "") -> AIMessage:
+    async def ask_for_actions(self, task_desc: str, last_outputs: str = "") -> AIMessage:
         # last_outputs = textual feedback of what we just tried
         prompt = f"""
         We are working on: "{task_desc}".
@@ -54,14 +80,14 @@ class Agent:
         Based on the task and the outputs, what should be the next step?
         """
         try:
-            return call_llm(prompt, system_prompt=ACTION_SYSTEM_PROMPT, tools=TOOLS)
+            return await call_llm_async(prompt, system_prompt=ACTION_SYSTEM_PROMPT, tools=TOOLS)
         except Exception as e:
             self.logger._log(f"ask_for_actions failed: {e}")
             return AIMessage(content="Failed to get actions.")
 
     # ---------- ask LLM if task is done ----------
     @show_progress("Validating...", "")
-    def ask_if_done(self, task_desc: str, recent_results: str) -> bool:
+    async def ask_if_done(self, task_desc: str, recent_results: str) -> bool:
         prompt = f"""
         We were trying to complete the task: "{task_desc}".
         Here is a history of tool outputs from the session so far: {recent_results}
@@ -69,14 +95,14 @@ class Agent:
         Is the task done?
         """
         try:
-            resp = call_llm(prompt, system_prompt=VALIDATION_SYSTEM_PROMPT, output_schema=IsDone)
+            resp = await call_llm_async(prompt, system_prompt=VALIDATION_SYSTEM_PROMPT, output_schema=IsDone)
             return resp.done
-        except:
+        except Exception:
             return False
 
     # ---------- optimize tool arguments ----------
     @show_progress("Optimizing tool call...", "")
-    def optimize_tool_args(self, tool_name: str, initial_args: dict, task_desc: str) -> dict:
+    async def optimize_tool_args(self, tool_name: str, initial_args: dict, task_desc: str) -> dict:
         """Optimize tool arguments based on task requirements."""
         tool = next((t for t in TOOLS if t.name == tool_name), None)
         if not tool:
@@ -97,7 +123,7 @@ class Agent:
         Pay special attention to filtering parameters that would help narrow down results to match the task.
         """
         try:
-            response = call_llm(prompt, system_prompt=TOOL_ARGS_SYSTEM_PROMPT, output_schema=OptimizedToolArgs)
+            response = await call_llm_async(prompt, system_prompt=TOOL_ARGS_SYSTEM_PROMPT, output_schema=OptimizedToolArgs)
             # Handle case where LLM returns dict directly instead of OptimizedToolArgs
             if isinstance(response, dict):
                 return response if response else initial_args
@@ -107,13 +133,15 @@ class Agent:
             return initial_args
 
     # ---------- tool execution ----------
-    def _execute_tool(self, tool, tool_name: str, inp_args):
+    async def _execute_tool(self, tool, tool_name: str, inp_args):
         """Execute a tool with progress indication."""
         # Create a dynamic decorator with the tool name
         @show_progress(f"Executing {tool_name}...", "")
-        def run_tool():
-            return tool.run(inp_args)
-        return run_tool()
+        async def run_tool():
+            # Tools make blocking HTTP calls; keep them off the event loop.
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, tool.run, inp_args)
+        return await run_tool()
     
     # ---------- confirm action ----------
     def confirm_action(self, tool: str, input_str: str) -> bool:
@@ -123,6 +151,20 @@ class Agent:
 
     # ---------- main loop ----------
     def run(self, query: str):
+        """
+        Synchronous wrapper around ``arun`` for callers without an event loop.
+
+        Runs on a process-wide background loop so pooled LLM connections stay
+        valid across calls.
+        """
+        future = asyncio.run_coroutine_threadsafe(self.arun(query), _get_sync_loop())
+        try:
+            return future.result()
+        except BaseException:
+            future.cancel()
+            raise
+
+    async def arun(self, query: str):
         """
         Executes the main agent loop to process a user query.
 
@@ -145,11 +187,11 @@ class Agent:
         session_outputs = []
 
         # 1. Decompose the user query into a list of tasks.
-        tasks = self.plan_tasks(query)
+        tasks = await self.plan_tasks(query)
 
         # If no tasks were created, the query is likely out of scope.
         if not tasks:
-            answer = self._generate_answer(query, session_outputs)
+            answer = await self._generate_answer(query, session_outputs)
             self.logger.log_summary(answer)
             return answer
 
@@ -173,7 +215,7 @@ class Agent:
                     return
 
                 # Ask the LLM for the next action to take for the current task.
-                ai_message = self.ask_for_actions(task.description, last_outputs="\n".join(task_outputs))
+                ai_message = await self.ask_for_actions(task.description, last_outputs="\n".join(task_outputs))
                 
                 # If no tool is called, the task is considered complete.
                 if not ai_message.tool_calls:
@@ -190,7 +232,7 @@ class Agent:
                     initial_args = tool_call["args"]
                     
                     # Refine tool arguments for better performance.
-                    optimized_args = self.optimize_tool_args(tool_name, initial_args, task.description)
+                    optimized_args = await self.optimize_tool_args(tool_name, initial_args, task.description)
                     
                     # Create a signature of the action to be taken.
                     action_sig = f"{tool_name}:{optimized_args}"
@@ -207,7 +249,7 @@ class Agent:
                     tool_to_run = next((t for t in TOOLS if t.name == tool_name), None)
                     if tool_to_run and self.confirm_action(tool_name, str(optimized_args)):
                         try:
-                            result = self._execute_tool(tool_to_run, tool_name, optimized_args)
+                            result = await self._execute_tool(tool_to_run, tool_name, optimized_args)
                             self.logger.log_tool_run(tool_name, f"{result}")
                             output = f"Output of {tool_name} with args {optimized_args}: {result}"
                             session_outputs.append(output)
@@ -224,19 +266,19 @@ class Agent:
                     per_task_steps += 1
 
                 # After a batch of tool calls, check if the task is complete.
-                if self.ask_if_done(task.description, "\n".join(task_outputs)):
+                if await self.ask_if_done(task.description, "\n".join(task_outputs)):
                     task.done = True
                     self.logger.log_task_done(task.description)
                     break
 
         # 3. Synthesize the final answer from all collected tool outputs.
-        answer = self._generate_answer(query, session_outputs)
+        answer = await self._generate_answer(query, session_outputs)
         self.logger.log_summary(answer)
         return answer
     
     # ---------- answer generation ----------
     @show_progress("Generating answer...", "Answer ready")
-    def _generate_answer(self, query: str, session_outputs: list) -> str:
+    async def _generate_answer(self, query: str, session_outputs: list) -> str:
         """Generate the final answer based on collected data."""
         all_results = "\n\n".join(session_outputs) if session_outputs else "No data was collected."
         answer_prompt = f"""
@@ -248,5 +290,5 @@ class Agent:
         Based on the data above, provide a comprehensive answer to the user's query.
         Include specific numbers, calculations, and insights.
         """
-        answer_obj = call_llm(answer_prompt, system_prompt=ANSWER_SYSTEM_PROMPT, output_schema=Answer)
+        answer_obj = await call_llm_async(answer_prompt, system_prompt=ANSWER_SYSTEM_PROMPT, output_schema=Answer)
         return answer_obj.answer
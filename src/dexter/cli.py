@@ -3,30 +3,41 @@ from dotenv import load_dotenv
 # Load environment variables BEFORE importing any dexter modules
 load_dotenv()
 
+import asyncio
+
 from dexter.agent import Agent
 from dexter.utils.intro import print_intro
 from prompt_toolkit import PromptSession
 from prompt_toolkit.history import InMemoryHistory
 
-def main():
-    print_intro()
-    agent = Agent()
 
+async def _repl(agent: Agent):
     # Create a prompt session with history support
     session = PromptSession(history=InMemoryHistory())
 
     while True:
         try:
-            query = session.prompt(">> ")
+            query = await session.prompt_async(">> ")
             if query.lower() in ["exit", "quit"]:
                 print("Goodbye!")
                 break
             if query:
-                agent.run(query)
+                await agent.arun(query)
         except (KeyboardInterrupt, EOFError):
             print("\nGoodbye!")
             break
 
 
+def main():
+    print_intro()
+    agent = Agent()
+
+    # One event loop for the whole session so LLM connections are reused across queries
+    try:
+        asyncio.run(_repl(agent))
+    except KeyboardInterrupt:
+        print("\nGoodbye!")
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,222 @@
+"""Opt-in response cache for ``call_llm``.
+
+``DEXTER_LLM_CACHE=1`` enables an exact-match tier keyed on a SHA-256 of
+(model, system prompt, prompt, output schema, tools). ``DEXTER_LLM_CACHE=semantic``
+adds an embedding tier on top that serves a cached response for a free-text
+prompt whose cosine similarity to a previous one (same model and system prompt)
+is at least ``DEXTER_SEMCACHE_THRESHOLD``. The semantic tier needs the optional
+``sentence-transformers`` and ``faiss-cpu`` packages.
+
+Structured-output calls only use the exact tier: their prompts are long fixed
+templates around a short variable part (a ticker, a period), so near-identical
+embeddings would hand back another request's tool arguments or task plan.
+
+Calls that bind tools are never cached: their responses drive tool execution.
+"""
+
+import asyncio
+import copy
+import hashlib
+import inspect
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from dexter.prompts import DEFAULT_SYSTEM_PROMPT
+
+logger = logging.getLogger(__name__)
+
+_CACHE_MODE = os.getenv("DEXTER_LLM_CACHE", "").strip().lower()
+_CACHE_SIZE = int(os.getenv("DEXTER_LLM_CACHE_SIZE", "1024"))
+_SEMCACHE_THRESHOLD = float(os.getenv("DEXTER_SEMCACHE_THRESHOLD", "0.97"))
+_SEMCACHE_MODEL = os.getenv("DEXTER_SEMCACHE_MODEL", "sentence-transformers/all-MiniLM-L6-v2")
+
+
+def _signature(model_name: str, system_prompt: str, output_schema) -> List[Any]:
+    return [model_name, system_prompt, output_schema.__name__ if output_schema else None]
+
+
+def _digest(parts: List[Any]) -> str:
+    return hashlib.sha256(json.dumps(parts).encode()).hexdigest()
+
+
+def _keys(model_name: str, prompt: str, system_prompt: Optional[str], output_schema) -> Tuple[str, str]:
+    """Return the (semantic signature, exact key) digests for a tool-free call."""
+    signature = _signature(model_name, system_prompt or DEFAULT_SYSTEM_PROMPT, output_schema)
+    return _digest(signature), _digest(signature + [prompt, []])
+
+
+class ExactCache:
+    """Thread-safe LRU map from request digest to response."""
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            if key not in self._data:
+                return None
+            self._data.move_to_end(key)
+            return self._data[key]
+
+    def put(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+
+class SemanticCache:
+    """Nearest-neighbour lookup over prompt embeddings, one FAISS index per signature."""
+
+    def __init__(self, model_name: str, threshold: float, maxsize: int = 1024):
+        import faiss
+        from sentence_transformers import SentenceTransformer
+
+        self._faiss = faiss
+        self._encoder = SentenceTransformer(model_name)
+        self._dim = self._encoder.get_sentence_embedding_dimension()
+        self.threshold = threshold
+        self.maxsize = maxsize
+        self._indexes: Dict[str, Any] = {}
+        self._values: Dict[str, List[Any]] = {}
+        self._lock = threading.Lock()
+
+    def _embed(self, prompt: str):
+        return self._encoder.encode([prompt], normalize_embeddings=True).astype("float32")
+
+    def get(self, signature: str, prompt: str) -> Optional[Any]:
+        vec = self._embed(prompt)
+        with self._lock:
+            index = self._indexes.get(signature)
+            if index is None or index.ntotal == 0:
+                return None
+            scores, ids = index.search(vec, 1)
+            if scores[0][0] < self.threshold:
+                return None
+            return self._values[signature][ids[0][0]]
+
+    def put(self, signature: str, prompt: str, value: Any) -> None:
+        vec = self._embed(prompt)
+        with self._lock:
+            index = self._indexes.get(signature)
+            if index is None or index.ntotal >= self.maxsize:
+                # Flat indexes cannot evict single entries; start over once full.
+                index = self._faiss.IndexFlatIP(self._dim)
+                self._indexes[signature] = index
+                self._values[signature] = []
+            index.add(vec)
+            self._values[signature].append(value)
+
+
+def _build_semantic_cache() -> Optional[SemanticCache]:
+    try:
+        return SemanticCache(_SEMCACHE_MODEL, _SEMCACHE_THRESHOLD, _CACHE_SIZE)
+    except ImportError:
+        logger.warning(
+            "DEXTER_LLM_CACHE=semantic requires sentence-transformers and faiss-cpu; "
+            "falling back to exact-match caching"
+        )
+    except Exception:
+        # e.g. the embedding model cannot be downloaded on an offline host
+        logger.warning(
+            "Could not load semantic cache model %r; falling back to exact-match caching",
+            _SEMCACHE_MODEL,
+            exc_info=True,
+        )
+    return None
+
+
+_exact_cache: Optional[ExactCache] = None
+if _CACHE_MODE in ("1", "true", "exact", "semantic"):
+    _exact_cache = ExactCache(_CACHE_SIZE)
+
+# Built on first use so loading the embedding model never blocks importing dexter.model.
+_semantic_enabled = _CACHE_MODE == "semantic"
+_semantic_cache: Optional[SemanticCache] = None
+_semantic_lock = threading.Lock()
+
+
+def _get_semantic_cache() -> Optional[SemanticCache]:
+    global _semantic_enabled, _semantic_cache
+    if not _semantic_enabled or _semantic_cache is not None:
+        return _semantic_cache
+    with _semantic_lock:
+        if _semantic_enabled and _semantic_cache is None:
+            _semantic_cache = _build_semantic_cache()
+            _semantic_enabled = _semantic_cache is not None
+    return _semantic_cache
+
+
+def _semantic_get(signature: str, prompt: str) -> Optional[Any]:
+    cache = _get_semantic_cache()
+    return cache.get(signature, prompt) if cache is not None else None
+
+
+def _semantic_put(signature: str, prompt: str, value: Any) -> None:
+    cache = _get_semantic_cache()
+    if cache is not None:
+        cache.put(signature, prompt, value)
+
+
+def cache_llm_call(model_name: str) -> Callable:
+    """Decorate ``call_llm``/``call_llm_async`` so repeated tool-free requests skip the model."""
+
+    def decorator(func: Callable) -> Callable:
+        if _exact_cache is None:
+            return func
+
+        if inspect.iscoroutinefunction(func):
+
+            @wraps(func)
+            async def async_wrapper(prompt, system_prompt=None, output_schema=None, tools=None):
+                if tools:
+                    return await func(prompt, system_prompt, output_schema, tools)
+
+                signature, key = _keys(model_name, prompt, system_prompt, output_schema)
+                semantic = _semantic_enabled and output_schema is None
+                cached = _exact_cache.get(key)
+                if cached is None and semantic:
+                    # Model loading and embedding are blocking; keep them off the event loop.
+                    cached = await asyncio.to_thread(_semantic_get, signature, prompt)
+                if cached is not None:
+                    return copy.deepcopy(cached)
+
+                result = await func(prompt, system_prompt, output_schema, tools)
+                _exact_cache.put(key, copy.deepcopy(result))
+                if semantic:
+                    await asyncio.to_thread(_semantic_put, signature, prompt, copy.deepcopy(result))
+                return result
+
+            return async_wrapper
+
+        @wraps(func)
+        def wrapper(prompt, system_prompt=None, output_schema=None, tools=None):
+            if tools:
+                return func(prompt, system_prompt, output_schema, tools)
+
+            signature, key = _keys(model_name, prompt, system_prompt, output_schema)
+            semantic = _semantic_enabled and output_schema is None
+            cached = _exact_cache.get(key)
+            if cached is None and semantic:
+                cached = _semantic_get(signature, prompt)
+            if cached is not None:
+                # Callers mutate parsed outputs (e.g. marking tasks done).
+                return copy.deepcopy(cached)
+
+            result = func(prompt, system_prompt, output_schema, tools)
+            _exact_cache.put(key, copy.deepcopy(result))
+            if semantic:
+                _semantic_put(signature, prompt, copy.deepcopy(result))
+            return result
+
+        return wrapper
+
+    return decorator
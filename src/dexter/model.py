@@ -1,13 +1,30 @@
+import ast
+import asyncio
+import operator
 import os
+import random
+import re
+import sys
 import time
+from functools import lru_cache
+
+import httpx
 from langchain_openai import ChatOpenAI
 from langchain.prompts import ChatPromptTemplate
 from pydantic import BaseModel
-from typing import Type, List, Optional
+from typing import Dict, Type, List, Optional, Tuple
 from langchain_core.tools import BaseTool
 from langchain_core.messages import AIMessage
-from openai import APIConnectionError
+from langchain_core.runnables import Runnable
+from openai import (
+    APIConnectionError,
+    APITimeoutError,
+    DefaultAsyncHttpxClient,
+    DefaultHttpxClient,
+    RateLimitError,
+)
 
+from dexter.llm_cache import cache_llm_call
 from dexter.prompts import DEFAULT_SYSTEM_PROMPT
 
 # Initialize the OpenAI client (env-driven, defaults preserved)
@@ -15,47 +32,207 @@ _model_name = os.getenv("DEXTER_LLM_MODEL", "gpt-4.1")
 _api_key = os.getenv("OPENAI_API_KEY")
 _base_url = os.getenv("OPENAI_API_BASE")
 
-if _base_url:
-    llm = ChatOpenAI(model=_model_name, temperature=0, api_key=_api_key, base_url=_base_url)
-else:
-    llm = ChatOpenAI(model=_model_name, temperature=0, api_key=_api_key)
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=32, keepalive_expiry=60)
+
+
+@lru_cache(maxsize=8)
+def _make_llm(model: str, base_url: Optional[str]) -> ChatOpenAI:
+    """Build one client per (model, base_url) so connection pools are shared across calls.
+
+    The SDK's default httpx clients keep its timeout and redirect settings.
+    """
+    kwargs = {"base_url": base_url} if base_url else {}
+    return ChatOpenAI(
+        model=model,
+        temperature=0,
+        api_key=_api_key,
+        http_client=DefaultHttpxClient(limits=_HTTP_LIMITS),
+        http_async_client=DefaultAsyncHttpxClient(limits=_HTTP_LIMITS),
+        **kwargs,
+    )
+
+
+llm = _make_llm(_model_name, _base_url)
+
+# LLM dispatch settings are fixed for the life of the process; resolve them once
+_STRUCTURED_OUTPUT_METHODS = {"none", "function_calling", "json_schema"}
+_STRUCTURED_METHOD = os.getenv("DEXTER_LLM_STRUCTURED_OUTPUT_METHOD", "function_calling").strip().lower()
+if _STRUCTURED_METHOD not in _STRUCTURED_OUTPUT_METHODS:
+    _STRUCTURED_METHOD = "function_calling"
+_STRUCTURED_METHOD = sys.intern(_STRUCTURED_METHOD)
+_TOOL_BIND = sys.intern(os.getenv("DEXTER_LLM_TOOL_BIND", "bind").strip().lower())
+
+# Retry policy for transient API failures
+_MAX_RETRIES = int(os.getenv("DEXTER_LLM_MAX_RETRIES", "3"))
+_DEADLINE_S = float(os.getenv("DEXTER_LLM_DEADLINE_S", "30"))
+_BASE_BACKOFF = 0.5
+_MAX_BACKOFF = 8.0
+_RETRYABLE_ERRORS = (APIConnectionError, APITimeoutError, RateLimitError)
+
+# Prompts that are answered or rejected without calling the model
+_MAX_PROMPT_CHARS = int(os.getenv("DEXTER_MAX_PROMPT_CHARS", "1000000"))
+_ARITH = re.compile(r"^\s*\d+(\s*[+\-*/]\s*\d+)+\s*=?\s*$")
+_ARITH_OPERAND = re.compile(r"\d+")
+# Bounds keep ast.parse and _eval_arith well clear of recursion and float limits
+_ARITH_MAX_CHARS = 256
+_ARITH_MAX_OPERANDS = 32
+_ARITH_OPS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+}
+
+# Tools seen by call_llm, by name, so bound runnables can be cached on hashable keys
+_tool_registry: Dict[str, BaseTool] = {}
+
+
+@lru_cache(maxsize=128)
+def _get_prompt_template(system_prompt: str) -> ChatPromptTemplate:
+    return ChatPromptTemplate.from_messages([
+        ("system", system_prompt),
+        ("user", "{prompt}")
+    ])
+
+
+@lru_cache(maxsize=128)
+def _get_runnable(
+    output_schema_cls: Optional[Type[BaseModel]],
+    tools_key: Optional[Tuple[str, ...]],
+) -> Runnable:
+    if output_schema_cls:
+        if _STRUCTURED_METHOD == "none":
+            return llm
+        return llm.with_structured_output(output_schema_cls, method=_STRUCTURED_METHOD)
+    if tools_key and _TOOL_BIND == "bind":
+        return llm.bind_tools([_tool_registry[name] for name in tools_key])
+    return llm
+
+
+def _retry_after(exc: Exception) -> Optional[float]:
+    response = getattr(exc, "response", None)
+    if response is None:
+        return None
+    try:
+        return float(response.headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
+def _retry_delay(attempt: int, exc: Exception, start: float) -> Optional[float]:
+    """Jittered exponential backoff, or None when retries or the deadline are exhausted."""
+    if attempt >= _MAX_RETRIES:
+        return None
+    delay = min(_MAX_BACKOFF, _BASE_BACKOFF * 2 ** attempt) * (0.5 + random.random())
+    retry_after = _retry_after(exc)
+    if retry_after is not None:
+        delay = max(delay, retry_after)
+    if time.monotonic() - start + delay > _DEADLINE_S:
+        return None
+    return delay
+
+
+def _eval_arith(node: ast.AST):
+    if isinstance(node, ast.BinOp) and type(node.op) in _ARITH_OPS:
+        return _ARITH_OPS[type(node.op)](_eval_arith(node.left), _eval_arith(node.right))
+    if isinstance(node, ast.Constant) and isinstance(node.value, int):
+        return node.value
+    raise ValueError("unsupported arithmetic expression")
 
+
+def _preflight(
+    prompt: str,
+    output_schema: Optional[Type[BaseModel]],
+    tools: Optional[List[BaseTool]],
+) -> Optional[AIMessage]:
+    """Answer prompts that do not need the model, or reject ones it must not see."""
+    if len(prompt) > _MAX_PROMPT_CHARS:
+        raise ValueError(f"Prompt is {len(prompt)} characters; the limit is {_MAX_PROMPT_CHARS}")
+    if output_schema or tools:
+        return None
+    p = prompt.strip()
+    if not p:
+        return AIMessage(content="")
+    if (
+        len(p) <= _ARITH_MAX_CHARS
+        and _ARITH.match(p)
+        and len(_ARITH_OPERAND.findall(p)) <= _ARITH_MAX_OPERANDS
+    ):
+        try:
+            expr = ast.parse(p.rstrip("= \t\n"), mode="eval").body
+            return AIMessage(content=str(_eval_arith(expr)))
+        except (SyntaxError, ValueError, ZeroDivisionError, OverflowError, RecursionError):
+            return None
+    return None
+
+
+def _build_chain(
+    system_prompt: Optional[str],
+    output_schema: Optional[Type[BaseModel]],
+    tools: Optional[List[BaseTool]],
+) -> Runnable:
+    final_system_prompt = system_prompt if system_prompt else DEFAULT_SYSTEM_PROMPT
+    prompt_template = _get_prompt_template(final_system_prompt)
+
+    tools_key = None
+    if tools and not output_schema:
+        for t in tools:
+            _tool_registry[t.name] = t
+        tools_key = tuple(sorted(t.name for t in tools))
+    runnable = _get_runnable(output_schema, tools_key)
+
+    return prompt_template | runnable
+
+
+@cache_llm_call(_model_name)
 def call_llm(
     prompt: str,
     system_prompt: Optional[str] = None,
     output_schema: Optional[Type[BaseModel]] = None,
     tools: Optional[List[BaseTool]] = None,
 ) -> AIMessage:
-  final_system_prompt = system_prompt if system_prompt else DEFAULT_SYSTEM_PROMPT
-  
-  prompt_template = ChatPromptTemplate.from_messages([
-      ("system", final_system_prompt),
-      ("user", "{prompt}")
-  ])
-
-  runnable = llm
-  if output_schema:
-      _method = os.getenv("DEXTER_LLM_STRUCTURED_OUTPUT_METHOD", "function_calling").strip().lower()
-      if _method == "none":
-          runnable = llm
-      elif _method in ("function_calling", "json_schema"):
-          runnable = llm.with_structured_output(output_schema, method=_method)
-      else:
-          runnable = llm.with_structured_output(output_schema, method="function_calling")
-  elif tools:
-      _tool_bind = os.getenv("DEXTER_LLM_TOOL_BIND", "bind").strip().lower()
-      if _tool_bind == "bind":
-          runnable = llm.bind_tools(tools)
-      else:
-          runnable = llm
-  
-  chain = prompt_template | runnable
-  
-  # Retry logic for transient connection errors
-  for attempt in range(3):
-      try:
-          return chain.invoke({"prompt": prompt})
-      except APIConnectionError as e:
-          if attempt == 2:  # Last attempt
-              raise
-          time.sleep(0.5 * (2 ** attempt))  # 0.5s, 1s backoff
+    trivial = _preflight(prompt, output_schema, tools)
+    if trivial is not None:
+        return trivial
+
+    chain = _build_chain(system_prompt, output_schema, tools)
+
+    # Retry transient failures until the retry budget or deadline runs out
+    start = time.monotonic()
+    attempt = 0
+    while True:
+        try:
+            return chain.invoke({"prompt": prompt})
+        except _RETRYABLE_ERRORS as e:
+            delay = _retry_delay(attempt, e, start)
+            if delay is None:
+                raise
+            time.sleep(delay)
+            attempt += 1
+
+
+@cache_llm_call(_model_name)
+async def call_llm_async(
+    prompt: str,
+    system_prompt: Optional[str] = None,
+    output_schema: Optional[Type[BaseModel]] = None,
+    tools: Optional[List[BaseTool]] = None,
+) -> AIMessage:
+    """Async counterpart of ``call_llm``; backs off without blocking the event loop."""
+    trivial = _preflight(prompt, output_schema, tools)
+    if trivial is not None:
+        return trivial
+
+    chain = _build_chain(system_prompt, output_schema, tools)
+
+    start = time.monotonic()
+    attempt = 0
+    while True:
+        try:
+            return await chain.ainvoke({"prompt": prompt})
+        except _RETRYABLE_ERRORS as e:
+            delay = _retry_delay(attempt, e, start)
+            if delay is None:
+                raise
+            await asyncio.sleep(delay)
+            attempt += 1
@@ -1,21 +1,47 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import concurrent.futures
 import logging
-from typing import Any, Dict, Optional
-from uuid import uuid4
+import os
+import threading
+from collections import deque
+from secrets import token_urlsafe
+from typing import Deque, List, Optional, Tuple
 
-from fastapi import BackgroundTasks, FastAPI, HTTPException
+import msgspec
+from cachetools import TTLCache
+from fastapi import FastAPI, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-from sse_starlette.sse import EventSourceResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from pydantic import BaseModel, Field
+from sse_starlette.sse import EventSourceResponse, ServerSentEvent
 
 from dexter.agent import Agent
-from dexter.utils.event_logger import EventLogger
+from dexter.utils.event_logger import DoneEvent, ErrorEvent, Event, EventLogger, WarningEvent
 
 logger = logging.getLogger(__name__)
 
+_ENCODER = msgspec.json.Encoder()
+_SSE_MAX_BATCH = int(os.getenv("DEXTER_SSE_MAX_BATCH", "32"))
+_TERMINAL_EVENTS = {"done", "error"}
+_SSE_QUEUE_MAX = int(os.getenv("DEXTER_SSE_QUEUE_MAX", "1024"))
+# Chatty events that may be shed when a client falls behind; everything else is always kept.
+_DROPPABLE_EVENTS = {"log", "progress", "tool_run"}
+_SESSION_MAX = int(os.getenv("DEXTER_SESSION_MAX", "10000"))
+_SESSION_TTL_S = float(os.getenv("DEXTER_SESSION_TTL_S", "3600"))
+_AGENT_WORKERS = int(os.getenv("DEXTER_AGENT_WORKERS", "16"))
+_SSE_HEADERS = {
+    # Stop nginx-style proxies from buffering the stream.
+    "X-Accel-Buffering": "no",
+    "Cache-Control": "no-cache",
+    "Connection": "keep-alive",
+}
+_SSE_PING_S = 15
+_SSE_SEND_TIMEOUT_S = 5
+# How long a fully streamed session is kept around for late reconnects.
+_SESSION_LINGER_S = 60
+
 
 class RunRequest(BaseModel):
     query: str
@@ -24,39 +50,121 @@ class RunRequest(BaseModel):
 
 
 class RunResponse(BaseModel):
-    run_id: str
+    run_id: str = Field(description="URL-safe run identifier (96 random bits, 16 characters).")
 
 
 class AgentSession:
 
-    def __init__(self, loop: asyncio.AbstractEventLoop):
-        self.loop = loop
-        self.queue: asyncio.Queue[Dict[str, Any]] = asyncio.Queue()
+    def __init__(self):
+        # Events are serialized once by the producer; the buffer holds (type, json) pairs.
+        self.buf: Deque[Tuple[Optional[str], str]] = deque()
+        self.wake = asyncio.Event()
         self.finished = asyncio.Event()
         self.error: Optional[str] = None
+        self.dropped = 0
+        self._unreported_drops = 0
+        self.delivered = False
+        self.task: Optional[asyncio.Task] = None
+        # Reused for every encode; only this session's producer writes to it.
+        self._encode_buf = bytearray(4096)
+
+    def emit(self, payload: Event) -> None:
+        event_type = payload.kind
+        if len(self.buf) >= _SSE_QUEUE_MAX and event_type in _DROPPABLE_EVENTS:
+            self.dropped += 1
+            self._unreported_drops += 1
+            return
+        if self._unreported_drops and len(self.buf) < _SSE_QUEUE_MAX:
+            warning = WarningEvent(message=f"Dropped {self._unreported_drops} events")
+            self.buf.append(("warning", self._encode(warning)))
+            self._unreported_drops = 0
+        # Agent runs on the event loop, so producer and consumer share a thread.
+        self.buf.append((event_type, self._encode(payload)))
+        self.wake.set()
 
-    def emit(self, payload: Dict[str, Any]) -> None:
-        asyncio.run_coroutine_threadsafe(self.queue.put(payload), self.loop)
+    def _encode(self, payload: Event) -> str:
+        _ENCODER.encode_into(payload, self._encode_buf)
+        return self._encode_buf.decode()
+
+    @staticmethod
+    def _frame(batch: List[str]) -> ServerSentEvent:
+        if len(batch) == 1:
+            return ServerSentEvent(data=batch[0])
+        return ServerSentEvent(data="[" + ",".join(batch) + "]", event="batch")
 
     async def stream(self):
         try:
             while True:
-                payload = await self.queue.get()
-                yield {
-                    "data": json.dumps(payload, ensure_ascii=False),
-                }
-                if payload.get("type") in {"done", "error"}:
-                    break
+                await self.wake.wait()
+                self.wake.clear()
+                while self.buf:
+                    batch: List[str] = []
+                    terminal = False
+                    while self.buf and not terminal and len(batch) < _SSE_MAX_BATCH:
+                        event_type, data = self.buf.popleft()
+                        batch.append(data)
+                        terminal = event_type in _TERMINAL_EVENTS
+                    yield self._frame(batch)
+                    if terminal:
+                        self.delivered = True
+                        return
         finally:
             self.finished.set()
 
 
+class SessionCache(TTLCache):
+    """TTL/LRU session registry that counts runs evicted before their events were streamed."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        super().__init__(maxsize=maxsize, ttl=ttl)
+        self.evicted_undelivered = 0
+
+    def _on_evict(self, run_id: str, session: AgentSession) -> None:
+        if not session.delivered:
+            self.evicted_undelivered += 1
+            logger.warning(
+                "Evicted run %s before its events were streamed (%d total)",
+                run_id,
+                self.evicted_undelivered,
+            )
+
+    def popitem(self):
+        run_id, session = super().popitem()
+        self._on_evict(run_id, session)
+        return run_id, session
+
+    def expire(self, time=None):
+        expired = super().expire(time)
+        for run_id, session in expired:
+            self._on_evict(run_id, session)
+        return expired
+
+
 class DexterServer:
     def __init__(self):
         self.app = FastAPI(title="Dexter Server", version="0.1.0")
-        self.sessions: Dict[str, AgentSession] = {}
+        # TTLCache is not thread-safe; every access goes through _sessions_lock.
+        self.sessions = SessionCache(maxsize=_SESSION_MAX, ttl=_SESSION_TTL_S)
+        self._sessions_lock = threading.RLock()
+        # Blocking tool calls from agent runs get their own threads, off the loop's default executor.
+        self._agent_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=_AGENT_WORKERS, thread_name_prefix="dexter-agent"
+        )
+        self._agent_slots = threading.BoundedSemaphore(_AGENT_WORKERS)
         self._configure()
 
+    def _get_session(self, run_id: str) -> Optional[AgentSession]:
+        with self._sessions_lock:
+            return self.sessions.get(run_id)
+
+    def _add_session(self, run_id: str, session: AgentSession) -> None:
+        with self._sessions_lock:
+            self.sessions[run_id] = session
+
+    def _forget_session(self, run_id: str) -> None:
+        with self._sessions_lock:
+            self.sessions.pop(run_id, None)
+
     def _configure(self) -> None:
         self.app.add_middleware(
             CORSMiddleware,
@@ -65,52 +173,69 @@ class DexterServer:
             allow_methods=["*"],
             allow_headers=["*"],
         )
+        # Starlette >= 0.46 skips text/event-stream responses, so this only compresses regular JSON.
+        self.app.add_middleware(GZipMiddleware, minimum_size=512)
 
         @self.app.get("/health")
         async def health():
             return {"status": "ok"}
 
         @self.app.post("/api/run", response_model=RunResponse)
-        async def run_agent(request: RunRequest, background_tasks: BackgroundTasks):
-            loop = asyncio.get_running_loop()
-            run_id = str(uuid4())
-            session = AgentSession(loop)
-            self.sessions[run_id] = session
+        async def run_agent(request: RunRequest):
+            if not self._agent_slots.acquire(blocking=False):
+                raise HTTPException(status_code=503, detail="Too many runs in progress, try again later")
+            run_id = token_urlsafe(12)
+            session = AgentSession()
+            self._add_session(run_id, session)
 
-            def emit(payload: Dict[str, Any]) -> None:
+            def emit(payload: Event) -> None:
                 session.emit(payload)
 
-            def worker() -> None:
+            async def worker() -> None:
                 logger.info("Starting Dexter run %s", run_id)
+                event_logger = EventLogger(emit)
                 try:
                     agent = Agent(
                         max_steps=request.max_steps or 20,
                         max_steps_per_task=request.max_steps_per_task or 5,
-                        logger=EventLogger(emit),
+                        logger=event_logger,
+                        executor=self._agent_pool,
                     )
-                    answer = agent.run(request.query)
-                    emit({"type": "done", "answer": answer})
+                    answer = await agent.arun(request.query)
+                    event_logger.flush()
+                    emit(DoneEvent(answer=answer))
                 except Exception as exc:  # pragma: no cover - defensive logging
                     logger.exception("Dexter run %s failed", run_id)
-                    emit({"type": "error", "message": str(exc)})
+                    event_logger.flush()
+                    emit(ErrorEvent(message=str(exc)))
                 finally:
                     session.finished.set()
+                    self._agent_slots.release()
 
-            background_tasks.add_task(loop.run_in_executor, None, worker)
+            session.task = asyncio.create_task(worker())
             return RunResponse(run_id=run_id)
 
         @self.app.get("/api/run/{run_id}/events")
         async def stream_events(run_id: str):
-            session = self.sessions.get(run_id)
+            session = self._get_session(run_id)
             if session is None:
                 raise HTTPException(status_code=404, detail="Run not found")
+            if session.delivered:
+                # 204 tells EventSource clients to stop reconnecting.
+                return Response(status_code=204)
 
             async def event_generator():
                 async for event in session.stream():
                     yield event
-                self.sessions.pop(run_id, None)
+                # Keep the session briefly so a reconnect gets a 204 rather than a 404.
+                asyncio.get_running_loop().call_later(_SESSION_LINGER_S, self._forget_session, run_id)
 
-            return EventSourceResponse(event_generator())
+            return EventSourceResponse(
+                event_generator(),
+                headers=_SSE_HEADERS,
+                ping=_SSE_PING_S,
+                send_timeout=_SSE_SEND_TIMEOUT_S,
+            )
 
     def get_app(self) -> FastAPI:
         return self.app
@@ -120,4 +245,27 @@ server = DexterServer()
 app = server.get_app()
 
 
-__all__ = ["app", "server"]
+def main() -> None:
+    import uvicorn
+
+    try:
+        import uvloop  # noqa: F401
+        loop = "uvloop"
+    except ImportError:
+        loop = "asyncio"
+
+    uvicorn.run(
+        "dexter.server:app",
+        host=os.getenv("DEXTER_HOST", "0.0.0.0"),
+        port=int(os.getenv("DEXTER_PORT", "8000")),
+        workers=int(os.getenv("DEXTER_WORKERS", "1")),
+        loop=loop,
+        http="auto",
+    )
+
+
+if __name__ == "__main__":
+    main()
+
+
+__all__ = ["app", "server", "main"]
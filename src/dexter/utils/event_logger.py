@@ -1,82 +1,170 @@
 from __future__ import annotations
 
-import json
+from collections import deque
 from contextlib import contextmanager
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Deque, Dict, List, Optional, Union
 
+import msgspec
+import orjson
+from msgspec import UNSET, UnsetType
 
-EventPayload = Dict[str, Any]
+
+class Event(msgspec.Struct, tag_field="type"):
+    """An event streamed to web clients; the subclass tag is encoded as its "type" field."""
+
+    @property
+    def kind(self) -> str:
+        return self.__struct_config__.tag
+
+
+class LogEvent(Event, tag="log"):
+    message: str
+    count: Union[int, UnsetType] = UNSET
+
+
+class HeaderEvent(Event, tag="header"):
+    message: str
+
+
+class UserQueryEvent(Event, tag="user_query"):
+    query: str
+
+
+class TaskListEvent(Event, tag="task_list"):
+    tasks: List[Dict[str, Any]]
+
+
+class TaskStartEvent(Event, tag="task_start"):
+    task: str
+
+
+class TaskDoneEvent(Event, tag="task_done"):
+    task: str
+
+
+class ToolRunEvent(Event, tag="tool_run"):
+    tool: str
+    result: Any = UNSET
+
+
+class WarningEvent(Event, tag="warning"):
+    message: str
+    tool: Union[str, UnsetType] = UNSET
+    input: Union[str, UnsetType] = UNSET
+
+
+class ProgressEvent(Event, tag="progress"):
+    status: str
+    message: str
+
+
+class AnswerEvent(Event, tag="answer"):
+    answer: str
+
+
+class DoneEvent(Event, tag="done"):
+    answer: Optional[str] = None
+
+
+class ErrorEvent(Event, tag="error"):
+    message: str
+
+
+# Consecutive duplicate log lines are reported every Nth repeat and when the run moves on.
+_DUP_REPORT_EVERY = 10
+_LOG_HISTORY = 10_000
+_JSON_START_CHARS = frozenset('{["-0123456789tfn')
 
 
 class EventLogger:
 
-    def __init__(self, emit: Callable[[EventPayload], None]):
-        self.emit = emit
-        self.log: List[str] = []
+    def __init__(self, emit: Callable[[Event], None]):
+        self._emit = emit
+        self.log: Deque[str] = deque(maxlen=_LOG_HISTORY)
+        self._last_msg: Optional[str] = None
+        self._last_count = 0
+        self._reported_count = 0
+
+    def flush(self):
+        """Report any duplicate log lines still being held back."""
+        if self._last_count > self._reported_count:
+            self._emit(LogEvent(message=self._last_msg, count=self._last_count))
+        self._last_msg = None
+        self._last_count = 0
+        self._reported_count = 0
+
+    def emit(self, payload: Event):
+        self.flush()
+        self._emit(payload)
 
     def _log(self, msg: str):
         self.log.append(msg)
-        self.emit({"type": "log", "message": msg})
+        if msg == self._last_msg:
+            self._last_count += 1
+            if self._last_count % _DUP_REPORT_EVERY == 0:
+                self._emit(LogEvent(message=msg, count=self._last_count))
+                self._reported_count = self._last_count
+            return
+        self.flush()
+        self._emit(LogEvent(message=msg))
+        self._last_msg = msg
+        self._last_count = 1
+        self._reported_count = 1
 
     def log_header(self, msg: str):
-        self.emit({"type": "header", "message": msg})
+        self.emit(HeaderEvent(message=msg))
 
     def log_user_query(self, query: str):
-        self.emit({"type": "user_query", "query": query})
+        self.emit(UserQueryEvent(query=query))
 
     def log_task_list(self, tasks: List[Dict[str, Any]]):
-        normalized = [
-            {
-                **task,
-                "done": bool(task.get("done", False)),
-            }
-            for task in tasks
-        ]
-        self.emit({"type": "task_list", "tasks": normalized})
+        # Normalize in place: callers hand over freshly built dicts, and "done" is usually a bool already.
+        for task in tasks:
+            done = task.get("done")
+            if done is True or done is False:
+                continue
+            task["done"] = bool(done)
+        self.emit(TaskListEvent(tasks=list(tasks)))
 
     def log_task_start(self, task_desc: str):
-        self.emit({"type": "task_start", "task": task_desc})
+        self.emit(TaskStartEvent(task=task_desc))
 
     def log_task_done(self, task_desc: str):
-        self.emit({"type": "task_done", "task": task_desc})
+        self.emit(TaskDoneEvent(task=task_desc))
 
     def log_tool_run(self, tool: str, result: str = ""):
-        payload: EventPayload = {"type": "tool_run", "tool": tool}
+        payload = ToolRunEvent(tool=tool)
         if result:
             parsed: Optional[Any] = None
-            try:
-                parsed = json.loads(result)
-            except Exception:
-                parsed = None
-            payload["result"] = parsed if parsed is not None else result
+            # Only hand the result to the parser if it could start a JSON value.
+            stripped = result.lstrip()
+            if stripped and stripped[0] in _JSON_START_CHARS:
+                try:
+                    parsed = orjson.loads(result)
+                except orjson.JSONDecodeError:
+                    parsed = None
+            payload.result = parsed if parsed is not None else result
         self.emit(payload)
 
     def log_risky(self, tool: str, input_str: str):
         self.emit(
-            {
-                "type": "warning",
-                "tool": tool,
-                "input": input_str,
-                "message": f"Risky action {tool}({input_str}) — auto-confirmed",
-            }
+            WarningEvent(
+                tool=tool,
+                input=input_str,
+                message=f"Risky action {tool}({input_str}) — auto-confirmed",
+            )
         )
 
     def log_summary(self, summary: str):
-        self.emit({"type": "answer", "answer": summary})
+        self.emit(AnswerEvent(answer=summary))
 
     @contextmanager
     def progress(self, message: str, success_message: str = ""):
-        self.emit({"type": "progress", "status": "start", "message": message})
+        self.emit(ProgressEvent(status="start", message=message))
         try:
             yield
             completed = success_message or message.replace("...", " ✓")
-            self.emit({"type": "progress", "status": "complete", "message": completed})
+            self.emit(ProgressEvent(status="complete", message=completed))
         except Exception as exc:
-            self.emit(
-                {
-                    "type": "progress",
-                    "status": "error",
-                    "message": f"{message} failed: {exc}",
-                }
-            )
+            self.emit(ProgressEvent(status="error", message=f"{message} failed: {exc}"))
             raise
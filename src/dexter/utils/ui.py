@@ -1,3 +1,4 @@
+import inspect
 import sys
 import time
 import threading
@@ -68,6 +69,27 @@ class Spinner:
 def show_progress(message: str, success_message: str = ""):
     """Decorator to show progress spinner while a function executes."""
     def decorator(func: Callable) -> Callable:
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                maybe_self = args[0] if args else None
+                logger = getattr(maybe_self, "logger", None)
+                progress_cm = getattr(logger, "progress", None) if logger else None
+                if callable(progress_cm):
+                    with progress_cm(message, success_message):
+                        return await func(*args, **kwargs)
+
+                spinner = Spinner(message, color=Colors.CYAN)
+                spinner.start()
+                try:
+                    result = await func(*args, **kwargs)
+                    spinner.stop(success_message or message.replace("...", " ✓"), symbol="✓", symbol_color=Colors.GREEN)
+                    return result
+                except Exception as e:
+                    spinner.stop(f"Failed: {str(e)}", symbol="✗", symbol_color=Colors.RED)
+                    raise
+            return async_wrapper
+
         @wraps(func)
         def wrapper(*args, **kwargs):
             maybe_self = args[0] if args else None
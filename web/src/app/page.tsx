@@ -124,7 +124,8 @@ function coerceDexterEvent(payload: unknown): DexterEvent | null {
     }
     case "log": {
       const message = typeof raw.message === "string" ? raw.message : ""
-      return { type: "log", message }
+      const count = typeof raw.count === "number" ? raw.count : undefined
+      return { type: "log", message, count }
     }
     case "header": {
       const message = typeof raw.message === "string" ? raw.message : ""
@@ -337,6 +338,21 @@ function useDexterRun() {
           }
         }
 
+        // Bursts of events arrive coalesced as a JSON array under the "batch" event name.
+        stream.addEventListener("batch", (event) => {
+          try {
+            const items = JSON.parse((event as MessageEvent<string>).data) as unknown[]
+            for (const item of items) {
+              const parsed = coerceDexterEvent(item)
+              if (parsed) {
+                handleEvent(parsed)
+              }
+            }
+          } catch (err) {
+            console.error("Failed to parse event batch", err)
+          }
+        })
+
         stream.onerror = (ev) => {
           console.error("EventSource error", ev)
           if (finishedRef.current) {
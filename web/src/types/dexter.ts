@@ -28,7 +28,7 @@ export type DexterEvent =
   | { type: "progress"; status: ProgressStatus; message: string }
   | { type: "tool_run"; tool: string; result?: unknown }
   | { type: "warning"; message: string; tool?: string; input?: string }
-  | { type: "log"; message: string }
+  | { type: "log"; message: string; count?: number }
   | { type: "header"; message: string }
   | { type: "user_query"; query: string }
   | { type: "answer"; answer: string }